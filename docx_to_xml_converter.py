@@ -1,23 +1,141 @@
 import os
 import sys
 import logging
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from typing import Optional, Dict, List
-import pythoncom
-import win32com.client
+import zipfile
+from typing import Optional, Dict, Iterable, Iterator, List, NamedTuple, Tuple
 import re
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    # Without lxml, parse with the standard library and write output with the fixed-format writer
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+# WordprocessingML namespace and the qualified tags read from document.xml / numbering.xml
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_P = f'{{{W_NS}}}p'
+W_T = f'{{{W_NS}}}t'
+W_TAB = f'{{{W_NS}}}tab'
+W_BR = f'{{{W_NS}}}br'
+W_CR = f'{{{W_NS}}}cr'
+W_NO_BREAK_HYPHEN = f'{{{W_NS}}}noBreakHyphen'
+W_TR = f'{{{W_NS}}}tr'
+W_TXBX_CONTENT = f'{{{W_NS}}}txbxContent'
+W_PPR = f'{{{W_NS}}}pPr'
+W_PSTYLE = f'{{{W_NS}}}pStyle'
+W_NUMPR = f'{{{W_NS}}}numPr'
+W_ILVL = f'{{{W_NS}}}ilvl'
+W_NUMID = f'{{{W_NS}}}numId'
+W_VAL = f'{{{W_NS}}}val'
+W_NUM = f'{{{W_NS}}}num'
+W_ABSTRACT_NUM = f'{{{W_NS}}}abstractNum'
+W_ABSTRACT_NUM_ID = f'{{{W_NS}}}abstractNumId'
+W_LVL = f'{{{W_NS}}}lvl'
+W_LVL_OVERRIDE = f'{{{W_NS}}}lvlOverride'
+W_START_OVERRIDE = f'{{{W_NS}}}startOverride'
+W_START = f'{{{W_NS}}}start'
+W_NUMFMT = f'{{{W_NS}}}numFmt'
+W_LVLTEXT = f'{{{W_NS}}}lvlText'
+W_STYLE = f'{{{W_NS}}}style'
+W_STYLE_ID = f'{{{W_NS}}}styleId'
+W_TYPE = f'{{{W_NS}}}type'
+W_NAME = f'{{{W_NS}}}name'
+W_BASED_ON = f'{{{W_NS}}}basedOn'
+
+# Tracked-change and comment markers; a paragraph containing any of these is skipped
+REVISION_TAGS = tuple(f'{{{W_NS}}}{tag}' for tag in ('ins', 'del', 'moveFrom', 'moveTo', 'pPrChange', 'rPrChange'))
+COMMENT_TAGS = tuple(f'{{{W_NS}}}{tag}' for tag in ('commentRangeStart', 'commentReference'))
+REVISION_OR_COMMENT_TAGS = REVISION_TAGS + COMMENT_TAGS
+
+# Run content that stands for a character in the paragraph text, besides the <w:t> text itself
+_RUN_CHARACTERS = {W_TAB: '\t', W_BR: '\n', W_CR: '\n', W_NO_BREAK_HYPHEN: '-'}
+RUN_TEXT_TAGS = (W_T,) + tuple(_RUN_CHARACTERS)
+
+# Patterns used per paragraph, compiled once at import
+_HEADING_RE = re.compile(r'Heading\s*(\d+)', re.IGNORECASE)
+_LEVEL_REF_RE = re.compile(r'%(\d)')
+_REQ_RE = re.compile(r'\[([^\]]+)\]')
+
+# Built-in heading style ids (and their spaced names) mapped to their level
+_HEADING_LEVELS = {**{f'Heading{i}': i for i in range(1, 10)}, **{f'Heading {i}': i for i in range(1, 10)}}
+
+# Extra entities the fixed-format writer escapes to match lxml's serializer
+_TEXT_ENTITIES = {'\r': '&#13;'}
+_ATTR_ENTITIES = {'"': '&quot;', '\t': '&#9;', '\n': '&#10;', '\r': '&#13;'}
+
+# Preformatted 'level' attribute values; w:ilvl is 0-8 and Word's built-in headings are 1-9
+_LEVEL_STR = {level: str(level) for level in range(10)}
+
+
+@lru_cache(maxsize=None)
+def _split_level_text(lvl_text: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """
+    Splits a w:lvlText template into its literal parts and the 0-based levels it references.
+
+    :param lvl_text: The level text (e.g., '%1.%2.').
+    :return: (literals, refs), where literals has one more entry than refs.
+    """
+    parts = _LEVEL_REF_RE.split(lvl_text)
+    return tuple(parts[0::2]), tuple(int(ref) - 1 for ref in parts[1::2])
+
+_ROMAN_NUMERALS = ((1000, 'm'), (900, 'cm'), (500, 'd'), (400, 'cd'), (100, 'c'), (90, 'xc'),
+                   (50, 'l'), (40, 'xl'), (10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i'))
+
+
+def _format_letter(value: int) -> str:
+    """
+    Formats a list counter as Word's letter sequence (a..z, aa..zz, ...).
+
+    :param value: The counter value.
+    :return: Lowercase letter marker.
+    """
+    return chr(ord('a') + (value - 1) % 26) * ((value - 1) // 26 + 1)
+
+
+def _format_roman(value: int) -> str:
+    """
+    Formats a list counter as a roman numeral.
+
+    :param value: The counter value.
+    :return: Lowercase roman numeral.
+    """
+    roman = ''
+    for arabic, numeral in _ROMAN_NUMERALS:
+        count, value = divmod(value, arabic)
+        roman += numeral * count
+    return roman
+
+
+# w:numFmt values mapped to their counter formatter; unknown formats render as decimal
+_NUMBER_FORMATTERS = {
+    'decimal': str,
+    'lowerLetter': _format_letter,
+    'upperLetter': lambda value: _format_letter(value).upper(),
+    'lowerRoman': _format_roman,
+    'upperRoman': lambda value: _format_roman(value).upper(),
+    'none': lambda value: '',
+}
+
+# List item texts shorter than this are interned; markers always are
+_INTERN_MAX_LENGTH = 64
+
+# Output is written in many small pieces; batch them into 1 MiB writes
+_OUTPUT_BUFFER_SIZE = 1 << 20
 
 # Configure logging
-def setup_logging(verbose: bool = False):
+def setup_logging(verbose: bool = False, debug: bool = False):
     """
     Sets up logging to file and console.
 
     :param verbose: If True, sets console logging to INFO level. Else, WARNING.
+    :param debug: If True, writes per-paragraph DEBUG records to the log file. Else, INFO.
     """
     logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
     # File handler for detailed logs
     file_handler = logging.FileHandler('docx_to_xml.log', mode='a', encoding='utf-8')
@@ -36,28 +154,49 @@ def setup_logging(verbose: bool = False):
     console_handler.setLevel(console_level)
     logger.addHandler(console_handler)
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ListItem:
     number: str
     text: str
     level: int
     children: List['ListItem'] = field(default_factory=list)
 
+class Section(NamedTuple):
+    header: str
+    level: int
+    items: List[ListItem]
+
+class ConversionResult(NamedTuple):
+    input_path: str
+    output_path: Optional[str]
+    error: Optional[str]
+
 class DocxToXmlConverter:
     """
     A class to convert a DOCX file to an XML file, extracting multi-level lists and section headers.
     """
 
-    def __init__(self, input_path: str, output_path: Optional[str] = None):
+    def __init__(self, input_path: str, output_path: Optional[str] = None, fast_output: bool = False):
         """
         Initializes the converter with input and output paths.
 
         :param input_path: Path to the input DOCX file.
         :param output_path: Path to the output XML file. If None, replaces .docx with .xml.
+        :param fast_output: If True, writes the XML with the fixed-format writer instead of lxml.
+            Always used when lxml is not installed.
         """
         self.input_path = input_path
         self.output_path = output_path or self._generate_output_path()
-        self.word_app = None
+        self.fast_output = fast_output
+        self.numbering = {}
+        self.heading_levels = _HEADING_LEVELS
+        self.style_numbering = {}
+        self.list_counters = {}
+        # Resolved once per conversion so per-paragraph helpers skip DEBUG formatting cheaply
+        self.debug_enabled = False
 
     def _generate_output_path(self) -> str:
         """
@@ -68,217 +207,503 @@ class DocxToXmlConverter:
         base, _ = os.path.splitext(self.input_path)
         return f"{base}.xml"
 
-    def _initialize_word(self):
-        """
-        Initializes the Word application object.
-
-        Raises:
-            Exception: If Word application cannot be initialized.
-        """
-        try:
-            logging.info("Initializing Word application...")
-            pythoncom.CoInitialize()
-            self.word_app = win32com.client.Dispatch("Word.Application")
-            self.word_app.Visible = True
-            self.word_app.DisplayAlerts = 0  # wdAlertsNone
-            logging.info("Word application initialized successfully.")
-        except Exception as e:
-            logging.error(f"Failed to initialize Word application: {e}")
-            raise
-
-    def _cleanup_word(self):
-        """
-        Closes the Word application.
-        """
-        try:
-            if self.word_app:
-                logging.info("Closing Word application...")
-                self.word_app.Quit()
-                logging.info("Word application closed.")
-        except Exception as e:
-            logging.warning(f"Error while closing Word application: {e}")
-
     def convert(self):
         """
         Performs the conversion from DOCX to XML.
         """
         try:
-            self._initialize_word()
             logging.info(f"Opening DOCX file: {self.input_path}")
             try:
-                doc = self.word_app.Documents.Open(
-                    FileName=self.input_path,
-                    ReadOnly=True,
-                    AddToRecentFiles=False,
-                    Visible=False
-                )
-                logging.info("DOCX file opened successfully.")
+                docx = zipfile.ZipFile(self.input_path)
             except Exception as e:
                 logging.error(f"Failed to open DOCX file: {e}")
                 raise
 
-            content = self._extract_content(doc)
-            logging.info("Content extraction completed.")
-
-            root = self._build_xml(content)
-            logging.info("XML structure built successfully.")
-
-            xml_str = self._prettify_xml(root)
-            logging.info("XML string prepared for writing.")
-
-            logging.info(f"Writing XML to file: {self.output_path}")
-            try:
-                with open(self.output_path, 'w', encoding='utf-8') as f:
-                    f.write(xml_str)
-                logging.info("XML file written successfully.")
-            except Exception as e:
-                logging.error(f"Failed to write XML file: {e}")
-                raise
-
-            doc.Close(False)
-            logging.info("DOCX document closed.")
+            with docx:
+                self.numbering = self._load_numbering(docx)
+                self.heading_levels, self.style_numbering = self._load_styles(docx)
+                # Stream document.xml out of the archive so it is never fully decompressed in memory
+                with docx.open('word/document.xml') as document_xml:
+                    logging.info("DOCX file opened successfully.")
+                    # Sections are extracted lazily and written out as soon as each one is complete
+                    content = self._extract_content(document_xml)
+
+                    logging.info(f"Writing XML to file: {self.output_path}")
+                    # Extraction and writing are interleaved, so write to a sibling file and only move it
+                    # into place once the whole document is done; a failure never truncates a previous output
+                    temp_path = f"{self.output_path}.{os.getpid()}.tmp"
+                    written = False
+                    try:
+                        with self._open_output(temp_path) as f:
+                            if self.fast_output or not LXML_AVAILABLE:
+                                self._emit_fast(content, f)
+                            else:
+                                self._write_xml(content, f)
+                        os.replace(temp_path, self.output_path)
+                        written = True
+                        logging.info("XML file written successfully.")
+                    except Exception as e:
+                        logging.error(f"Failed to extract or write XML content: {e}")
+                        raise
+                    finally:
+                        # Also runs on KeyboardInterrupt, so an aborted run leaves nothing behind
+                        if not written:
+                            try:
+                                os.remove(temp_path)
+                            except OSError:
+                                pass
 
         except Exception as e:
             logging.error(f"An error occurred during conversion: {e}", exc_info=True)
             raise
-        finally:
-            self._cleanup_word()
 
-    def _extract_content(self, doc) -> Dict[str, Dict[str, any]]:
+    def _open_output(self, path: str):
         """
-        Extracts headers and multi-level lists from the Word document.
+        Opens an output file for writing with a large buffer.
 
-        :param doc: The opened Word document.
-        :return: Dictionary with headers as keys and their details (level and items) as values.
+        :param path: Path of the file to create or truncate.
+        :return: Binary file object.
         """
-        content = {}
-        current_header = None
-        current_header_level = 1
-        current_items = []
-        list_stack = []  # Stack to manage list hierarchy
-        total_paragraphs = doc.Paragraphs.Count
-        processed_paragraphs = 0
+        return open(path, 'wb', buffering=_OUTPUT_BUFFER_SIZE)
 
-        logging.info(f"Total paragraphs to process: {total_paragraphs}")
+    def _load_numbering(self, docx: zipfile.ZipFile) -> Dict[str, Tuple[str, Dict[int, tuple]]]:
+        """
+        Reads the list definitions from word/numbering.xml, applying each w:num's level and start overrides.
 
-        for para in doc.Paragraphs:
-            processed_paragraphs += 1
-            if processed_paragraphs % 50 == 0 or processed_paragraphs == total_paragraphs:
-                logging.info(f"Processed {processed_paragraphs}/{total_paragraphs} paragraphs.")
+        Lists that share an abstract definition without overrides continue one another's numbering;
+        a list with overrides (e.g., "Restart at 1" or "Set numbering value") counts on its own.
 
-            # Ignore if the paragraph is a revision or comment
-            if self._is_revision_or_comment(para):
-                continue
+        :param docx: The opened DOCX archive.
+        :return: Dictionary mapping numId to (counter key, {ilvl: (numFmt, lvlText, start)}).
+        """
+        try:
+            numbering_xml = docx.read('word/numbering.xml')
+        except KeyError:
+            logging.info("DOCX file has no numbering definitions.")
+            return {}
+
+        numbering_root = etree.fromstring(numbering_xml)
+        abstract_levels = {}
+        for abstract in numbering_root.iter(W_ABSTRACT_NUM):
+            abstract_levels[abstract.get(W_ABSTRACT_NUM_ID)] = {
+                int(lvl.get(W_ILVL, '0')): self._read_level(lvl) for lvl in abstract.iter(W_LVL)
+            }
 
-            style = para.Style.NameLocal
-            text = para.Range.Text.strip()
-            logging.debug(f"Processing paragraph {processed_paragraphs}: Style='{style}', Text='{text}'")
-
-            if self._is_heading(style):
-                if current_header:
-                    # Add the previous header and its items (even if items are empty)
-                    content[current_header] = {
-                        'level': current_header_level,
-                        'items': current_items
-                    }
-                    logging.info(f"Added header: '{current_header}' with level {current_header_level} and {len(current_items)} list items.")
-                current_header = text
-                current_header_level = self._get_heading_level_from_style(style)
-                current_items = []
-                list_stack = []
-                logging.info(f"Detected header: '{current_header}' with level {current_header_level}")
+        numbering = {}
+        for num in numbering_root.iter(W_NUM):
+            abstract_id = num.find(W_ABSTRACT_NUM_ID)
+            if abstract_id is None:
+                continue
+            num_id = num.get(W_NUMID)
+            abstract_id = abstract_id.get(W_VAL)
+            levels = abstract_levels.get(abstract_id, {})
+            overrides = num.findall(W_LVL_OVERRIDE)
+            if not overrides:
+                numbering[num_id] = (f'abstract:{abstract_id}', levels)
                 continue
+            levels = dict(levels)
+            for override in overrides:
+                ilvl = int(override.get(W_ILVL, '0'))
+                lvl = override.find(W_LVL)
+                if lvl is not None:
+                    levels[ilvl] = self._read_level(lvl)
+                start_override = override.find(W_START_OVERRIDE)
+                if start_override is not None:
+                    num_fmt, lvl_text, _ = levels.get(ilvl, ('decimal', f'%{ilvl + 1}.', 1))
+                    levels[ilvl] = (num_fmt, lvl_text, int(start_override.get(W_VAL)))
+            numbering[num_id] = (num_id, levels)
+        logging.info(f"Loaded {len(numbering)} list definitions.")
+        return numbering
+
+    def _read_level(self, lvl) -> tuple:
+        """
+        Reads one w:lvl definition.
+
+        :param lvl: The <w:lvl> element.
+        :return: (numFmt, lvlText, start).
+        """
+        num_fmt = lvl.find(W_NUMFMT)
+        lvl_text = lvl.find(W_LVLTEXT)
+        start = lvl.find(W_START)
+        return (
+            num_fmt.get(W_VAL) if num_fmt is not None else 'decimal',
+            lvl_text.get(W_VAL, '') if lvl_text is not None else '',
+            int(start.get(W_VAL)) if start is not None else 1
+        )
+
+    def _load_styles(self, docx: zipfile.ZipFile) -> Tuple[Dict[str, int], Dict[str, Tuple[str, Optional[int]]]]:
+        """
+        Reads the paragraph styles from word/styles.xml.
 
-            if not text:
+        Every style named 'heading N' is added to the heading lookup table; localized documents keep the
+        built-in name but use a translated style id (e.g., 'berschrift1'). Styles that number their
+        paragraphs (e.g., 'List Number', 'List Bullet'), directly or through w:basedOn, are collected too.
+
+        :param docx: The opened DOCX archive.
+        :return: (heading_levels, style_numbering). heading_levels maps style id to heading level, including
+            the built-in 'HeadingN' ids; style_numbering maps style id to (numId, ilvl or None).
+        """
+        try:
+            styles_xml = docx.read('word/styles.xml')
+        except KeyError:
+            logging.info("DOCX file has no style definitions.")
+            return _HEADING_LEVELS, {}
+
+        heading_levels = dict(_HEADING_LEVELS)
+        based_on = {}
+        own_numbering = {}
+        for style in etree.fromstring(styles_xml).iter(W_STYLE):
+            style_id = style.get(W_STYLE_ID)
+            # w:type defaults to paragraph when omitted
+            if style.get(W_TYPE, 'paragraph') != 'paragraph' or style_id is None:
+                continue
+            parent = style.find(W_BASED_ON)
+            if parent is not None:
+                based_on[style_id] = parent.get(W_VAL)
+            num_pr = style.find(f'{W_PPR}/{W_NUMPR}')
+            if num_pr is not None:
+                num_id = num_pr.find(W_NUMID)
+                ilvl = num_pr.find(W_ILVL)
+                try:
+                    own_numbering[style_id] = (num_id.get(W_VAL) if num_id is not None else None,
+                                               int(ilvl.get(W_VAL)) if ilvl is not None else None)
+                except (TypeError, ValueError) as e:
+                    logging.warning("Ignoring list numbering of style %s: %s", style_id, e)
+            name = style.find(W_NAME)
+            if name is None or style_id in heading_levels:
                 continue
+            level = _HEADING_LEVELS.get(name.get(W_VAL, '').capitalize())
+            if level is not None:
+                heading_levels[style_id] = level
+
+        style_numbering = {}
+        for style_id in based_on.keys() | own_numbering.keys():
+            # Walk up w:basedOn; numId and ilvl are each inherited from the nearest style that sets them
+            num_id = ilvl = None
+            seen = set()
+            current = style_id
+            while current is not None and current not in seen:
+                seen.add(current)
+                own_num_id, own_ilvl = own_numbering.get(current, (None, None))
+                if num_id is None:
+                    num_id = own_num_id
+                if ilvl is None:
+                    ilvl = own_ilvl
+                current = based_on.get(current)
+            if num_id is not None and num_id != '0':
+                style_numbering[style_id] = (num_id, ilvl)
+        logging.info("Loaded %d heading styles and %d numbered styles.",
+                     len(heading_levels) - len(_HEADING_LEVELS), len(style_numbering))
+        return heading_levels, style_numbering
+
+    def _extract_content(self, document_xml) -> Iterator[Section]:
+        """
+        Extracts headers and multi-level lists from the document body.
+
+        :param document_xml: File-like object holding word/document.xml.
+        :return: Iterator of Section records in document order, each yielded once its section ends.
+        """
+        current_header = None
+        current_header_level = 1
+        current_items = []
+        list_stack = []  # Stack to manage list hierarchy
+        processed_paragraphs = 0
+        self.list_counters = {}
+        self.debug_enabled = debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        # Bind per-paragraph callables to locals so the loop avoids repeated attribute lookups
+        is_revision_or_comment = self._is_revision_or_comment
+        classify_style = self._classify_style
+        get_text = self._get_paragraph_text
+        resolve_numbering = self._resolve_numbering
+        style_numbering = self.style_numbering
+        format_list_string = self._format_list_string
+        create_list_item = self._create_list_item
+        add_list_item = self._add_list_item_to_content
+        log_info = logging.info
+
+        for processed_paragraphs, para in enumerate(self._iter_paragraphs(document_xml), 1):
+            # The total is unknown while streaming, so report a running count
+            if processed_paragraphs % 500 == 0:
+                log_info("Processed %d paragraphs.", processed_paragraphs)
 
-            if para.Range.ListFormat.ListType != 0:  # 0 means no list
-                list_item = self._create_list_item(para)
+            try:
+                # Resolve the paragraph properties once; style and numbering both live under it
+                ppr = para.find(W_PPR)
+                style_element = ppr.find(W_PSTYLE) if ppr is not None else None
+                style = style_element.get(W_VAL, '') if style_element is not None else 'Normal'
+                if debug_enabled:
+                    logging.debug("Processing paragraph %d: Style='%s'", processed_paragraphs, style)
+
+                is_heading, heading_level = classify_style(style)
+                if not is_heading:
+                    num_pr = ppr.find(W_NUMPR) if ppr is not None else None
+                    if num_pr is None and style not in style_numbering:
+                        # Non-list paragraphs are not extracted, so neither their text nor their runs are walked
+                        continue
+                    numbering = resolve_numbering(num_pr, style)
+                    if numbering is None:
+                        continue
+                    # Word numbers every list paragraph, including empty ones and the revisions and
+                    # comments skipped below, so the counters advance before any of those checks
+                    list_level = numbering[1]
+                    list_string = format_list_string(*numbering)
+
+                # Ignore if the paragraph is a revision or comment
+                if is_revision_or_comment(para):
+                    continue
+
+                if is_heading:
+                    if current_header:
+                        # Add the previous header and its items (even if items are empty)
+                        log_info("Added header: '%s' with level %d and %d list items.", current_header, current_header_level, len(current_items))
+                        yield Section(current_header, current_header_level, current_items)
+                    current_header = get_text(para)
+                    current_header_level = heading_level
+                    current_items = []
+                    list_stack = []
+                    log_info("Detected header: '%s' with level %d", current_header, current_header_level)
+                    continue
+
+                text = get_text(para)
+                if not text:
+                    continue
+
+                list_item = create_list_item(list_string, list_level, text)
                 if list_item:
-                    self._add_list_item_to_content(list_item, current_items, list_stack)
-            else:
-                # Handle non-list paragraphs if needed
-                continue
+                    add_list_item(list_item, current_items, list_stack)
+            finally:
+                # Release the processed paragraph and its earlier siblings to keep memory flat
+                para.clear()
+                if LXML_AVAILABLE:
+                    while para.getprevious() is not None:
+                        del para.getparent()[0]
+
+        logging.info("Processed %d paragraphs.", processed_paragraphs)
 
         # Add the last header and its items (even if items are empty)
         if current_header:
-            content[current_header] = {
-                'level': current_header_level,
-                'items': current_items
-            }
-            logging.info(f"Added header: '{current_header}' with level {current_header_level} and {len(current_items)} list items.")
+            logging.info("Added header: '%s' with level %d and %d list items.", current_header, current_header_level, len(current_items))
+            yield Section(current_header, current_header_level, current_items)
 
         logging.info("Completed content extraction.")
-        return content
+
+    def _iter_paragraphs(self, document_xml) -> Iterator:
+        """
+        Yields each <w:p> element of document.xml as soon as it has been fully parsed.
+
+        Like Word's Paragraphs collection, only the main story is covered: paragraphs inside text
+        boxes (w:txbxContent) are skipped. Word stores each text box twice, in mc:Choice and in
+        mc:Fallback, so including them would duplicate their list items. The text box contents are
+        also dropped from the tree so they do not leak into the anchoring paragraph's text.
+
+        With lxml, finished table rows are released too, so long tables do not keep the
+        emptied row and cell skeletons of every processed paragraph in the partial tree.
+
+        :param document_xml: File-like object holding word/document.xml.
+        :return: Iterator of <w:p> elements in document order.
+        """
+        if not LXML_AVAILABLE:
+            # xml.etree's iterparse has no tag filter and no parent links, so track text box nesting
+            text_box_depth = 0
+            for event, elem in etree.iterparse(document_xml, events=('start', 'end')):
+                tag = elem.tag
+                if tag == W_TXBX_CONTENT:
+                    if event == 'start':
+                        text_box_depth += 1
+                    else:
+                        text_box_depth -= 1
+                        elem.clear()
+                elif tag == W_P and event == 'end' and not text_box_depth:
+                    yield elem
+            return
+
+        for _, elem in etree.iterparse(document_xml, events=('end',), tag=(W_P, W_TR, W_TXBX_CONTENT)):
+            tag = elem.tag
+            if tag == W_P:
+                if next(elem.iterancestors(W_TXBX_CONTENT), None) is None:
+                    yield elem
+            elif tag == W_TXBX_CONTENT:
+                elem.clear()
+            else:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
 
     def _is_revision_or_comment(self, para) -> bool:
         """
-        Checks if the paragraph is a revision or a comment.
+        Checks if the paragraph contains a tracked revision or a comment.
 
-        :param para: The paragraph object.
+        :param para: The <w:p> element.
         :return: True if it's a revision or comment, False otherwise.
         """
-        try:
-            if para.Range.Revisions.Count > 0:
-                logging.debug("Paragraph is a revision; ignoring.")
-                return True
-            if para.Range.Comments.Count > 0:
-                logging.debug("Paragraph has comments; ignoring.")
-                return True
-        except Exception as e:
-            logging.warning(f"Failed to check revisions/comments: {e}")
+        # One descendant walk for both kinds of markup; the first hit decides
+        if LXML_AVAILABLE:
+            markers = para.iter(*REVISION_OR_COMMENT_TAGS)
+        else:
+            markers = (elem for elem in para.iter() if elem.tag in REVISION_OR_COMMENT_TAGS)
+        for marker in markers:
+            if self.debug_enabled:
+                if marker.tag in COMMENT_TAGS:
+                    logging.debug("Paragraph has comments; ignoring.")
+                else:
+                    logging.debug("Paragraph is a revision; ignoring.")
+            return True
         return False
 
-    def _is_heading(self, style: str) -> bool:
+    def _get_paragraph_text(self, para) -> str:
         """
-        Determines if the paragraph style is a heading.
+        Concatenates the <w:t> text of a paragraph, with tabs, line breaks and non-breaking hyphens.
 
-        :param style: The style name.
-        :return: True if it's a heading style, False otherwise.
+        :param para: The <w:p> element.
+        :return: The stripped paragraph text.
         """
-        return style.startswith('Heading')
-
-    def _get_heading_level_from_style(self, style: str) -> int:
+        if LXML_AVAILABLE:
+            nodes = para.iter(*RUN_TEXT_TAGS)
+        else:
+            nodes = (elem for elem in para.iter() if elem.tag in RUN_TEXT_TAGS)
+        # A w:tab with a w:val is a tab stop under w:pPr/w:tabs, not a tab character
+        return ''.join([
+            (node.text or '') if node.tag == W_T else '' if node.get(W_VAL) is not None else _RUN_CHARACTERS[node.tag]
+            for node in nodes
+        ]).strip()
+
+    def _classify_style(self, style: str) -> Tuple[bool, int]:
         """
-        Extracts the heading level from the style name.
+        Determines if the paragraph style is a heading and, if so, its level, in a single pass.
 
-        :param style: The style name (e.g., 'Heading 1', 'Heading 2').
-        :return: Heading level as integer.
+        :param style: The style id (e.g., 'Heading1', 'Heading2').
+        :return: (is_heading, level). Level is 0 for non-headings and defaults to 1 when no number is found.
         """
-        match = re.search(r'Heading\s+(\d+)', style, re.IGNORECASE)
+        level = self.heading_levels.get(style)
+        if level is not None:
+            # Built-in 'Heading1'..'Heading9' styles and styles named 'heading N': a single dict probe
+            return True, level
+        if not style.startswith('Heading'):
+            return False, 0
+        tail = style[7:].lstrip()
+        if tail.isdecimal():
+            return True, int(tail)
+        match = _HEADING_RE.search(style)
         if match:
             level = int(match.group(1))
-            logging.debug(f"Extracted heading level: {level} from style '{style}'")
-            return level
-        logging.debug(f"Failed to extract heading level from style '{style}'. Defaulting to 1.")
-        return 1
+            if self.debug_enabled:
+                logging.debug("Extracted heading level: %d from style '%s'", level, style)
+            return True, level
+        if self.debug_enabled:
+            logging.debug("Failed to extract heading level from style '%s'. Defaulting to 1.", style)
+        return True, 1
+
+    def _resolve_numbering(self, num_pr, style: str) -> Optional[Tuple[str, int]]:
+        """
+        Reads the list a paragraph belongs to, from its own numPr or from its paragraph style.
+
+        A direct numPr overrides the style's numId and ilvl individually.
+
+        :param num_pr: The paragraph's <w:numPr> element, or None.
+        :param style: The paragraph's style id.
+        :return: (numId, 0-based level), or None if the paragraph is not numbered.
+        """
+        try:
+            num_id, level = self.style_numbering.get(style, (None, None))
+            if num_pr is not None:
+                num_id_element = num_pr.find(W_NUMID)
+                if num_id_element is not None:
+                    num_id = num_id_element.get(W_VAL)
+                ilvl = num_pr.find(W_ILVL)
+                if ilvl is not None:
+                    level = int(ilvl.get(W_VAL))
+            if num_id is None or num_id == '0':
+                # numId 0 explicitly removes numbering inherited from the style
+                return None
+            return num_id, level or 0
+        except Exception as e:
+            logging.warning("Failed to read list numbering: %s", e)
+            return None
 
-    def _create_list_item(self, para) -> Optional[ListItem]:
+    def _create_list_item(self, list_string: str, level: int, text: str) -> Optional[ListItem]:
         """
         Creates a ListItem object from a list paragraph.
 
-        :param para: The paragraph object.
+        :param list_string: The rendered list marker.
+        :param level: The 0-based list level.
+        :param text: The stripped paragraph text.
         :return: ListItem object or None.
         """
         try:
-            text = para.Range.Text.strip()
-            level = para.Range.ListFormat.ListLevelNumber
-            list_string = para.Range.ListFormat.ListString
-
             # Clean the text by removing the list marker
-            cleaned_text = re.sub(r'^\s*(?:\d+|[a-zA-Z])[).]\s*', '', text)
+            cleaned_text = self._strip_list_marker(text)
+            if len(cleaned_text) < _INTERN_MAX_LENGTH:
+                # Short item texts ('N/A', 'Yes', ...) repeat often; share one string per value
+                cleaned_text = sys.intern(cleaned_text)
 
             list_item = ListItem(
-                number=f"{list_string}",
+                number=sys.intern(list_string),
                 text=cleaned_text,
-                level=level - 1  # Convert to 0-based indexing
+                level=level  # w:ilvl is already 0-based
             )
-            logging.debug(f"Created ListItem: {list_item}")
+            if self.debug_enabled:
+                logging.debug("Created ListItem: %s", list_item)
             return list_item
         except Exception as e:
-            logging.warning(f"Failed to create ListItem: {e}")
+            logging.warning("Failed to create ListItem: %s", e)
             return None
 
+    def _strip_list_marker(self, text: str) -> str:
+        """
+        Removes a typed list marker (digits or a single letter followed by ')' or '.') from the start of the text.
+
+        Hand-rolled equivalent of re.sub(r'^\s*(?:\d+|[a-zA-Z])[).]\s*', '', text, count=1).
+
+        :param text: The paragraph text.
+        :return: Text without the leading marker, or the text unchanged if it has none.
+        """
+        n = len(text)
+        i = 0
+        while i < n and text[i].isspace():
+            i += 1
+        j = i
+        while j < n and text[j].isdecimal():
+            j += 1
+        if j == i:
+            if i < n and text[i].isascii() and text[i].isalpha():
+                j += 1
+            else:
+                return text
+        if j == n or text[j] not in ').':
+            return text
+        j += 1
+        while j < n and text[j].isspace():
+            j += 1
+        return text[j:]
+
+    def _format_list_string(self, num_id: Optional[str], level: int) -> str:
+        """
+        Advances the counters of a list and renders the marker Word would display.
+
+        :param num_id: The w:numId of the list.
+        :param level: The 0-based list level.
+        :return: Rendered list marker (e.g., '1.', 'a)', '2.1').
+        """
+        counter_key, levels = self.numbering.get(num_id, (num_id, {}))
+        counters = self.list_counters.setdefault(counter_key, {})
+        counters[level] = counters.get(level, levels.get(level, ('decimal', '', 1))[2] - 1) + 1
+        for deeper in [lvl for lvl in counters if lvl > level]:
+            del counters[deeper]
+
+        num_fmt, lvl_text, _ = levels.get(level, ('decimal', f'%{level + 1}.', 1))
+        if num_fmt == 'bullet' or '%' not in lvl_text:
+            # Bullets and literal markers have no level placeholders to render
+            return lvl_text
+
+        literals, refs = _split_level_text(lvl_text)
+        pieces = [literals[0]]
+        for ref, literal in zip(refs, literals[1:]):
+            ref_fmt, _, ref_start = levels.get(ref, ('decimal', '', 1))
+            pieces.append(_NUMBER_FORMATTERS.get(ref_fmt, str)(counters.get(ref, ref_start)))
+            pieces.append(literal)
+        return ''.join(pieces)
+
     def _add_list_item_to_content(self, list_item: ListItem, current_items: List[ListItem], list_stack: List[ListItem]):
         """
         Adds a ListItem to the current_items list, handling hierarchy based on level.
@@ -287,85 +712,210 @@ class DocxToXmlConverter:
         :param current_items: The current list of ListItems under the current header.
         :param list_stack: Stack to manage current hierarchy levels.
         """
+        debug_enabled = self.debug_enabled
         try:
             # Adjust the stack to the current level
             while len(list_stack) > list_item.level:
                 popped = list_stack.pop()
-                logging.debug(f"Popped from stack: {popped.number}")
+                if debug_enabled:
+                    logging.debug("Popped from stack: %s", popped.number)
 
             if list_item.level == 0:
                 current_items.append(list_item)
                 list_stack.append(list_item)
-                logging.info(f"Added ListItem to current_items: {list_item.number} {list_item.text}")
+                if debug_enabled:
+                    logging.debug("Added ListItem to current_items: %s %s", list_item.number, list_item.text)
             else:
                 if list_stack:
                     parent = list_stack[-1]
                     parent.children.append(list_item)
                     list_stack.append(list_item)
-                    logging.info(f"Added ListItem as child to '{parent.number}': {list_item.number} {list_item.text}")
+                    if debug_enabled:
+                        logging.debug("Added ListItem as child to '%s': %s %s", parent.number, list_item.number, list_item.text)
                 else:
                     # If stack is empty, treat it as a top-level item
                     current_items.append(list_item)
                     list_stack.append(list_item)
-                    logging.info(f"Added ListItem to current_items (no parent): {list_item.number} {list_item.text}")
+                    if debug_enabled:
+                        logging.debug("Added ListItem to current_items (no parent): %s %s", list_item.number, list_item.text)
         except Exception as e:
-            logging.warning(f"Failed to add ListItem to content: {e}")
+            logging.warning("Failed to add ListItem to content: %s", e)
 
-    def _build_xml(self, content: Dict[str, Dict[str, any]]) -> ET.Element:
+    def _write_xml(self, content: Iterable[Section], out):
         """
-        Builds an XML Element from the extracted content.
+        Streams the extracted content as XML, element by element.
 
-        :param content: Dictionary with headers as keys and their details as values.
-        :return: Root XML Element.
+        No XML tree is built; lxml's xmlfile writer emits each Header and ListItem as it is visited.
+
+        :param content: Iterable of Section records in document order.
+        :param out: Binary file-like object to write to.
+        """
+        info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+        index = 0
+        with etree.xmlfile(out, encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element('Document'):
+                for index, (header, level, items) in enumerate(content, 1):
+                    xf.write('\n  ')
+                    with xf.element('Header', {'level': _LEVEL_STR.get(level) or str(level)}):
+                        xf.write(header)
+                        if info_enabled:
+                            logging.info("Added Header to XML: '%s' with level %d", header, level)
+                        if items:
+                            self._write_list_items_xml(xf, items)
+                            xf.write('\n  ')
+                    if index % 1000 == 0:
+                        xf.flush()
+                if index:
+                    xf.write('\n')
+        out.write(b'\n')
+        logging.info("XML structure written successfully.")
+
+    def _write_list_items_xml(self, xf, items: List[ListItem]):
         """
-        root = ET.Element('Document')
+        Streams ListItems and all of their descendants into the open xmlfile, depth-first in document order.
 
-        for header, details in content.items():
-            header_element = ET.SubElement(root, 'Header', attrib={'level': str(details['level'])})
-            header_element.text = header
-            logging.info(f"Added Header to XML: '{header}' with level {details['level']}")
+        Every ListItem starts on its own line, indented two spaces per nesting level below its Header.
 
-            for item in details['items']:
-                self._add_list_item_to_xml(header_element, item)
+        :param xf: The lxml incremental writer, positioned inside the parent Header.
+        :param items: The ListItems to write.
+        """
+        debug_enabled = self.debug_enabled
+        # Explicit stack instead of recursion; None marks where an open ListItem must be closed.
+        # Each ListItem with children is held open by its own ExitStack, and the outer one
+        # closes whatever is still open if writing fails part-way.
+        with ExitStack() as all_levels:
+            open_levels = []
+            stack = list(reversed(items))
+            while stack:
+                item = stack.pop()
+                # The Header sits at depth 1, so top-level items are at depth 2
+                if item is None:
+                    level = open_levels.pop()
+                    xf.write('\n' + '  ' * (len(open_levels) + 2))
+                    level.close()
+                    continue
+                xf.write('\n' + '  ' * (len(open_levels) + 2))
+                attrib = {
+                    'level': _LEVEL_STR.get(item.level) or str(item.level),
+                    'marker': item.number
+                }
+                if not item.children:
+                    with xf.element('ListItem', attrib):
+                        xf.write(item.text)
+                else:
+                    level = all_levels.enter_context(ExitStack())
+                    level.enter_context(xf.element('ListItem', attrib))
+                    xf.write(item.text)
+                    open_levels.append(level)
+                    stack.append(None)
+                    stack.extend(reversed(item.children))
+                if debug_enabled:
+                    logging.debug("Added ListItem to XML: %s %s", item.number, item.text)
+
+    def _emit_fast(self, content: Iterable[Section], out):
+        """
+        Writes the extracted content with a fixed-format writer specialized for the
+        Document > Header > ListItem schema, without building any XML elements.
 
-        logging.info("XML structure built successfully.")
-        return root
+        Produces the same bytes as _write_xml.
 
-    def _add_list_item_to_xml(self, parent_xml: ET.Element, list_item: ListItem):
+        :param content: Iterable of Section records in document order.
+        :param out: Binary file-like object to write to.
         """
-        Recursively adds ListItem elements to the XML.
+        # Imported here: xml.sax.saxutils pulls in urllib at import time
+        from xml.sax.saxutils import escape
+
+        # Markers and boilerplate text repeat heavily; memoize escaping for the duration of this document
+        escape_text = lru_cache(maxsize=8192)(partial(escape, entities=_TEXT_ENTITIES))
+        escape_attr = lru_cache(maxsize=8192)(partial(escape, entities=_ATTR_ENTITIES))
+
+        write = out.write
+        write(b"<?xml version='1.0' encoding='UTF-8'?>\n<Document>")
+        wrote_header = False
+        for header, level, items in content:
+            wrote_header = True
+            write(f'\n  <Header level="{level}">{escape_text(header)}'.encode())
+            # None marks where an open ListItem is closed, so nested items are emitted without recursion
+            stack = list(reversed(items))
+            depth = 2
+            while stack:
+                item = stack.pop()
+                if item is None:
+                    depth -= 1
+                    write(b'\n' + b'  ' * depth + b'</ListItem>')
+                    continue
+                write(f'\n{"  " * depth}<ListItem level="{item.level}" marker="{escape_attr(item.number)}">'
+                      f'{escape_text(item.text)}'.encode())
+                if item.children:
+                    depth += 1
+                    stack.append(None)
+                    stack.extend(reversed(item.children))
+                else:
+                    write(b'</ListItem>')
+            write(b'\n  </Header>' if items else b'</Header>')
+        if wrote_header:
+            write(b'\n')
+        write(b'</Document>\n')
+        logging.info("XML structure written successfully.")
+
+def _convert_one(input_path: str, fast_output: bool = False) -> str:
+    """
+    Converts a single DOCX file. Module-level so it can be pickled for worker processes.
 
-        :param parent_xml: The parent XML element.
-        :param list_item: The ListItem to add.
-        """
-        try:
-            list_element = ET.SubElement(parent_xml, 'ListItem', attrib={
-                'level': str(list_item.level),
-                'marker': list_item.number
-            })
-            list_element.text = list_item.text
-            logging.info(f"Added ListItem to XML: {list_item.number} {list_item.text}")
+    :param input_path: Path to the input DOCX file.
+    :param fast_output: If True, writes the XML with the fixed-format writer.
+    :return: Path to the written XML file.
+    """
+    converter = DocxToXmlConverter(input_path=input_path, fast_output=fast_output)
+    converter.convert()
+    return converter.output_path
 
-            for child in list_item.children:
-                self._add_list_item_to_xml(list_element, child)
+def _try_convert_one(input_path: str, fast_output: bool = False) -> ConversionResult:
+    """
+    Converts a single DOCX file, reporting a failure instead of raising so one bad file does not abort a batch.
 
-        except Exception as e:
-            logging.warning(f"Failed to add ListItem to XML: {e}")
+    :param input_path: Path to the input DOCX file.
+    :param fast_output: If True, writes the XML with the fixed-format writer.
+    :return: ConversionResult with either the output path or the error message.
+    """
+    if not os.path.isfile(input_path):
+        logging.error(f"Input file does not exist: {input_path}")
+        return ConversionResult(input_path, None, "Input file does not exist")
+    try:
+        return ConversionResult(input_path, _convert_one(input_path, fast_output), None)
+    except Exception as e:
+        logging.error("Failed to convert %s: %s", input_path, e)
+        return ConversionResult(input_path, None, str(e))
 
-    def _prettify_xml(self, elem: ET.Element) -> str:
-        """
-        Returns a pretty-printed XML string for the Element.
+def convert_many(paths: List[str], num_workers: Optional[int] = None, fast_output: bool = False) -> List[ConversionResult]:
+    """
+    Converts several DOCX files in parallel across worker processes.
 
-        :param elem: The root XML element.
-        :return: Pretty-printed XML string.
-        """
-        rough_string = ET.tostring(elem, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+    :param paths: Paths to the input DOCX files.
+    :param num_workers: Number of worker processes. Defaults to os.cpu_count().
+    :param fast_output: If True, writes the XML with the fixed-format writer.
+    :return: One ConversionResult per input, in the same order as the inputs.
+    """
+    # Never start more workers than there are files; with a single worker the pool is pure overhead
+    num_workers = min(num_workers or os.cpu_count() or 1, len(paths))
+    if num_workers <= 1:
+        return [_try_convert_one(path, fast_output) for path in paths]
+
+    # Imported here so single-file runs do not pay for loading multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Hand each worker several files per round trip so large batches of small documents are not IPC-bound
+    chunksize = max(1, len(paths) // (num_workers * 4))
+    logging.info("Converting %d files with %d workers...", len(paths), num_workers)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(partial(_try_convert_one, fast_output=fast_output), paths, chunksize=chunksize))
 
 def extract_requirements(text: str) -> List[str]:
     """Extract requirement IDs from text."""
-    return re.findall(r'\[([^\]]+)\]', text)
+    if '[' not in text:
+        return []
+    return _REQ_RE.findall(text)
 
 def main():
     """
@@ -374,21 +924,46 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Convert DOCX to XML, extracting lists and headers.')
-    parser.add_argument('input', help='Path to the input DOCX file.')
-    parser.add_argument('-o', '--output', help='Path to the output XML file. If not provided, replaces .docx with .xml.')
+    parser.add_argument('input', nargs='+', help='Path(s) to the input DOCX file(s).')
+    parser.add_argument('-o', '--output', help='Path to the output XML file. If not provided, replaces .docx with .xml. Only valid with a single input.')
+    parser.add_argument('--workers', type=int, help='Number of worker processes when converting several files. Defaults to the CPU count.')
+    parser.add_argument('--fast-output', action='store_true', help='Write the XML with the fixed-format writer instead of lxml.')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose output to the console.')
+    parser.add_argument('--debug', action='store_true', help='Write per-paragraph debug details to docx_to_xml.log.')
 
     args = parser.parse_args()
+    if args.output and len(args.input) > 1:
+        parser.error('-o/--output can only be used with a single input file.')
 
     # Setup logging with optional verbosity
-    setup_logging(verbose=args.verbose)
+    setup_logging(verbose=args.verbose, debug=args.debug)
 
-    if not os.path.isfile(args.input):
-        logging.error(f"Input file does not exist: {args.input}")
-        print(f"Error: Input file does not exist: {args.input}")
+    if len(args.input) > 1:
+        # Missing inputs are reported per file alongside the other results
+        try:
+            logging.info("Starting batch conversion process...")
+            results = convert_many(args.input, num_workers=args.workers, fast_output=args.fast_output)
+        except Exception as e:
+            print(f"Conversion failed: {e}")
+            sys.exit(1)
+        failed = 0
+        for result in results:
+            if result.error is None:
+                print(f"Conversion successful. XML saved to: {result.output_path}")
+            else:
+                failed += 1
+                print(f"Conversion failed for {result.input_path}: {result.error}")
+        if failed:
+            print(f"{failed} of {len(results)} files failed to convert.")
+            sys.exit(1)
+        return
+
+    if not os.path.isfile(args.input[0]):
+        logging.error(f"Input file does not exist: {args.input[0]}")
+        print(f"Error: Input file does not exist: {args.input[0]}")
         sys.exit(1)
 
-    converter = DocxToXmlConverter(input_path=args.input, output_path=args.output)
+    converter = DocxToXmlConverter(input_path=args.input[0], output_path=args.output, fast_output=args.fast_output)
     try:
         logging.info("Starting conversion process...")
         converter.convert()
@@ -0,0 +1,316 @@
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+import xml.etree.ElementTree as ET
+from unittest import mock
+from xml.sax.saxutils import escape
+
+import docx_to_xml_converter as converter
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def level(ilvl, num_fmt, lvl_text, start=1):
+    return (f'<w:lvl w:ilvl="{ilvl}"><w:start w:val="{start}"/><w:numFmt w:val="{num_fmt}"/>'
+            f'<w:lvlText w:val="{lvl_text}"/></w:lvl>')
+
+
+NUMBERING = (
+    f'<w:numbering xmlns:w="{W_NS}">'
+    '<w:abstractNum w:abstractNumId="0">'
+    + level(0, 'decimal', '%1.') + level(1, 'lowerLetter', '%2)') + level(2, 'lowerRoman', '%1.%2.%3') +
+    '</w:abstractNum>'
+    '<w:abstractNum w:abstractNumId="1">' + level(0, 'bullet', '•') + '</w:abstractNum>'
+    '<w:abstractNum w:abstractNumId="2">' + level(0, 'upperLetter', '%1.', start=3) + '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>'
+    '<w:num w:numId="3"><w:abstractNumId w:val="2"/></w:num>'
+    '<w:num w:numId="4"><w:abstractNumId w:val="0"/>'
+    '<w:lvlOverride w:ilvl="0"><w:startOverride w:val="5"/></w:lvlOverride></w:num>'
+    '</w:numbering>'
+)
+
+
+def paragraph(text='', style=None, num_id=None, ilvl=0, runs=None):
+    """Builds a <w:p> with an optional style and numbering; runs replaces the default single text run."""
+    ppr = f'<w:pStyle w:val="{style}"/>' if style else ''
+    if num_id is not None:
+        ppr += f'<w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/></w:numPr>'
+    if runs is None:
+        runs = f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>' if text else ''
+    return f'<w:p>{f"<w:pPr>{ppr}</w:pPr>" if ppr else ""}{runs}</w:p>'
+
+
+def write_docx(path, paragraphs, numbering=NUMBERING, styles=None):
+    """Writes a minimal DOCX archive holding the given paragraphs."""
+    document = (f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}"><w:body>'
+                + ''.join(paragraphs) + '</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('word/document.xml', document)
+        if numbering is not None:
+            docx.writestr('word/numbering.xml', numbering)
+        if styles is not None:
+            docx.writestr('word/styles.xml', f'<w:styles xmlns:w="{W_NS}">{styles}</w:styles>')
+
+
+def summarize(element):
+    """Reduces a Header or ListItem to (marker or level, text, children) with layout whitespace removed."""
+    key = element.get('marker') if element.tag == 'ListItem' else element.get('level')
+    return key, (element.text or '').strip(), [summarize(child) for child in element]
+
+
+class ConverterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # Failure tests log tracebacks on purpose; keep the test output readable
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def convert(self, paragraphs, fast_output=False, **kwargs):
+        input_path = self.path('input.docx')
+        write_docx(input_path, paragraphs, **kwargs)
+        output_path = self.path('fast.xml' if fast_output else 'output.xml')
+        converter.DocxToXmlConverter(input_path, output_path, fast_output=fast_output).convert()
+        with open(output_path, 'rb') as f:
+            return f.read()
+
+    def headers(self, paragraphs, **kwargs):
+        root = ET.fromstring(self.convert(paragraphs, **kwargs))
+        return [summarize(header) for header in root]
+
+
+class HeadingTests(ConverterTestCase):
+    def test_built_in_heading_levels(self):
+        headers = self.headers([
+            paragraph('Intro', 'Heading1'),
+            paragraph('ignored body text'),
+            paragraph('Details', 'Heading2'),
+        ])
+        self.assertEqual(headers, [('1', 'Intro', []), ('2', 'Details', [])])
+
+    def test_localized_heading_style_ids(self):
+        styles = ('<w:style w:type="paragraph" w:styleId="berschrift1"><w:name w:val="heading 1"/></w:style>'
+                  '<w:style w:type="paragraph" w:styleId="berschrift3"><w:name w:val="heading 3"/></w:style>')
+        headers = self.headers([paragraph('Einleitung', 'berschrift1'), paragraph('Teil', 'berschrift3')],
+                               styles=styles)
+        self.assertEqual(headers, [('1', 'Einleitung', []), ('3', 'Teil', [])])
+
+    def test_style_type_defaults_to_paragraph(self):
+        styles = ('<w:style w:styleId="Titel2"><w:name w:val="heading 2"/></w:style>'
+                  '<w:style w:type="character" w:styleId="Titel3"><w:name w:val="heading 3"/></w:style>')
+        headers = self.headers([paragraph('Untyped', 'Titel2'), paragraph('Character', 'Titel3')],
+                               styles=styles)
+        self.assertEqual(headers, [('2', 'Untyped', [])])
+
+    def test_empty_document(self):
+        self.assertEqual(self.convert([paragraph('no headers here')]),
+                         b"<?xml version='1.0' encoding='UTF-8'?>\n<Document></Document>\n")
+
+
+class ListTests(ConverterTestCase):
+    def test_nested_lists_and_number_formats(self):
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('First', num_id=1),
+            paragraph('Sub', num_id=1, ilvl=1),
+            paragraph('Deep', num_id=1, ilvl=2),
+            paragraph('Sub two', num_id=1, ilvl=1),
+            paragraph('Second', num_id=1),
+            paragraph('Bullet', num_id=2),
+            paragraph('Lettered', num_id=3),
+        ])
+        self.assertEqual(headers, [('1', 'Section', [
+            ('1.', 'First', [('a)', 'Sub', [('1.a.i', 'Deep', [])]), ('b)', 'Sub two', [])]),
+            ('2.', 'Second', []),
+            ('•', 'Bullet', []),
+            ('C.', 'Lettered', []),
+        ])])
+
+    def test_typed_marker_is_stripped_from_text(self):
+        headers = self.headers([paragraph('Section', 'Heading1'), paragraph('1) Typed marker', num_id=1)])
+        self.assertEqual(headers[0][2], [('1.', 'Typed marker', [])])
+
+    def test_skipped_paragraphs_still_advance_the_counter(self):
+        commented = '<w:commentRangeStart w:id="0"/><w:r><w:t>four</w:t></w:r>'
+        revised = '<w:ins w:id="1" w:author="a"><w:r><w:t>six</w:t></w:r></w:ins>'
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('one', num_id=1),
+            paragraph('', num_id=1),
+            paragraph('three', num_id=1),
+            paragraph(num_id=1, runs=commented),
+            paragraph('five', num_id=1),
+            paragraph(num_id=1, runs=revised),
+            paragraph('seven', num_id=1),
+        ])
+        self.assertEqual(headers[0][2], [('1.', 'one', []), ('3.', 'three', []), ('5.', 'five', []),
+                                         ('7.', 'seven', [])])
+
+    def test_revised_heading_is_skipped(self):
+        revised = '<w:del w:id="1" w:author="a"><w:r><w:delText>Old</w:delText></w:r></w:del>'
+        headers = self.headers([paragraph('Kept', 'Heading1'), paragraph(style='Heading1', runs=revised)])
+        self.assertEqual(headers, [('1', 'Kept', [])])
+
+    def test_numbering_inherited_from_style(self):
+        styles = ('<w:style w:type="paragraph" w:styleId="ListNumber"><w:name w:val="List Number"/>'
+                  '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr></w:pPr></w:style>'
+                  '<w:style w:type="paragraph" w:styleId="Derived"><w:basedOn w:val="ListNumber"/></w:style>'
+                  '<w:style w:type="paragraph" w:styleId="Unnumbered"><w:basedOn w:val="ListNumber"/>'
+                  '<w:pPr><w:numPr><w:numId w:val="0"/></w:numPr></w:pPr></w:style>')
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('styled', 'ListNumber'),
+            paragraph('derived', 'Derived'),
+            paragraph('plain', 'Unnumbered'),
+        ], styles=styles)
+        self.assertEqual(headers[0][2], [('1.', 'styled', []), ('2.', 'derived', [])])
+
+    def test_malformed_style_numbering_is_ignored(self):
+        styles = ('<w:style w:type="paragraph" w:styleId="Broken"><w:name w:val="List Number"/>'
+                  '<w:pPr><w:numPr><w:ilvl/><w:numId w:val="1"/></w:numPr></w:pPr></w:style>')
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('broken', 'Broken'),
+            paragraph('direct', num_id=1),
+        ], styles=styles)
+        self.assertEqual(headers, [('1', 'Section', [('1.', 'direct', [])])])
+
+    def test_start_override_restarts_numbering(self):
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('one', num_id=1),
+            paragraph('five', num_id=4),
+            paragraph('six', num_id=4),
+        ])
+        self.assertEqual(headers[0][2], [('1.', 'one', []), ('5.', 'five', []), ('6.', 'six', [])])
+
+    def test_text_box_paragraphs_are_skipped(self):
+        boxed = paragraph('boxed', num_id=1)
+        anchor = ('<w:r><w:t>anchor</w:t></w:r><w:r><mc:AlternateContent>'
+                  f'<mc:Choice Requires="wps"><w:drawing><w:txbxContent>{boxed}</w:txbxContent></w:drawing></mc:Choice>'
+                  f'<mc:Fallback><w:pict><w:txbxContent>{boxed}</w:txbxContent></w:pict></mc:Fallback>'
+                  '</mc:AlternateContent></w:r>')
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph('first', num_id=1),
+            paragraph(num_id=1, runs=anchor),
+            paragraph('second', num_id=1),
+        ])
+        self.assertEqual(headers[0][2], [('1.', 'first', []), ('2.', 'anchor', []), ('3.', 'second', [])])
+
+    def test_tabs_and_breaks_are_kept(self):
+        runs = ('<w:r><w:t>tab</w:t><w:tab/><w:t>after</w:t><w:br/><w:t>non</w:t>'
+                '<w:noBreakHyphen/><w:t>breaking</w:t></w:r>')
+        headers = self.headers([
+            paragraph('Section', 'Heading1'),
+            paragraph(num_id=1, runs=runs),
+        ])
+        self.assertEqual(headers[0][2], [('1.', 'tab\tafter\nnon-breaking', [])])
+
+    def test_tab_stop_definitions_are_not_text(self):
+        heading = ('<w:p><w:pPr><w:pStyle w:val="Heading1"/><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs>'
+                   '</w:pPr><w:r><w:t>Title</w:t></w:r></w:p>')
+        self.assertEqual(self.headers([heading]), [('1', 'Title', [])])
+
+
+class OutputTests(ConverterTestCase):
+    PARAGRAPHS = [
+        paragraph('Section & "quoted" <1>', 'Heading1'),
+        paragraph('First', num_id=1),
+        paragraph('Sub', num_id=1, ilvl=1),
+        paragraph('Second', num_id=1),
+        paragraph('Empty section', 'Heading2'),
+    ]
+
+    def test_layout(self):
+        self.assertEqual(self.convert(self.PARAGRAPHS).decode('utf-8'), (
+            "<?xml version='1.0' encoding='UTF-8'?>\n"
+            '<Document>\n'
+            '  <Header level="1">Section &amp; "quoted" &lt;1&gt;\n'
+            '    <ListItem level="0" marker="1.">First\n'
+            '      <ListItem level="1" marker="a)">Sub</ListItem>\n'
+            '    </ListItem>\n'
+            '    <ListItem level="0" marker="2.">Second</ListItem>\n'
+            '  </Header>\n'
+            '  <Header level="2">Empty section</Header>\n'
+            '</Document>\n'
+        ))
+
+    @unittest.skipUnless(converter.LXML_AVAILABLE, 'lxml is not installed')
+    def test_writers_produce_identical_output(self):
+        self.assertEqual(self.convert(self.PARAGRAPHS), self.convert(self.PARAGRAPHS, fast_output=True))
+
+    @unittest.skipUnless(converter.LXML_AVAILABLE, 'lxml is not installed')
+    def test_standard_library_fallback(self):
+        input_path = self.path('input.docx')
+        write_docx(input_path, self.PARAGRAPHS)
+        output_path = self.path('fallback.xml')
+        # Block lxml in a fresh interpreter so the module takes its xml.etree path
+        script = ("import sys, runpy; sys.modules['lxml'] = None; sys.argv = sys.argv[1:]; "
+                  "runpy.run_path(sys.argv[0], run_name='__main__')")
+        subprocess.run([sys.executable, '-c', script, os.path.join(REPO_DIR, 'docx_to_xml_converter.py'),
+                        input_path, '-o', output_path],
+                       check=True, cwd=self.tmp.name, capture_output=True)
+        with open(output_path, 'rb') as f:
+            self.assertEqual(f.read(), self.convert(self.PARAGRAPHS))
+
+    def test_failed_conversion_keeps_previous_output(self):
+        output_path = self.path('output.xml')
+        with open(output_path, 'wb') as f:
+            f.write(b'previous')
+        input_path = self.path('broken.docx')
+        with zipfile.ZipFile(input_path, 'w') as docx:
+            docx.writestr('word/document.xml', f'<w:document xmlns:w="{W_NS}"><w:body>'
+                          + paragraph('Section', 'Heading1') + '<w:p>')
+        with self.assertRaises(Exception):
+            converter.DocxToXmlConverter(input_path, output_path).convert()
+        with open(output_path, 'rb') as f:
+            self.assertEqual(f.read(), b'previous')
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['broken.docx', 'output.xml'])
+
+    def test_interrupted_conversion_removes_temp_file(self):
+        input_path = self.path('input.docx')
+        write_docx(input_path, self.PARAGRAPHS)
+        for writer in ('_emit_fast', '_write_xml'):
+            with mock.patch.object(converter.DocxToXmlConverter, writer, side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    converter.DocxToXmlConverter(input_path, self.path('output.xml'),
+                                                 fast_output=writer == '_emit_fast').convert()
+            self.assertEqual(os.listdir(self.tmp.name), ['input.docx'])
+
+    def test_convert_many_reports_each_failure(self):
+        good = self.path('good.docx')
+        write_docx(good, self.PARAGRAPHS)
+        missing = self.path('missing.docx')
+        results = converter.convert_many([good, missing], num_workers=1)
+        self.assertEqual([result.input_path for result in results], [good, missing])
+        self.assertEqual(results[0].output_path, self.path('good.xml'))
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].output_path)
+        self.assertEqual(results[1].error, 'Input file does not exist')
+
+    def test_batch_with_missing_input_converts_the_rest(self):
+        good = self.path('good.docx')
+        write_docx(good, self.PARAGRAPHS)
+        missing = self.path('missing.docx')
+        run = subprocess.run([sys.executable, os.path.join(REPO_DIR, 'docx_to_xml_converter.py'),
+                              good, missing, '--workers', '1'],
+                             cwd=self.tmp.name, capture_output=True, text=True)
+        self.assertEqual(run.returncode, 1)
+        self.assertTrue(os.path.isfile(self.path('good.xml')))
+        self.assertIn(f'Conversion failed for {missing}: Input file does not exist', run.stdout)
+        self.assertIn('1 of 2 files failed to convert.', run.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()